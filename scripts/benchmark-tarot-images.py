@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for generate-tarot-images.py.
+
+Starts mock-image-api.py on a free local port, runs the generator against it
+once per mode (sequential, then concurrent) into a throwaway directory, and
+reports cards per minute, peak memory and retry overhead from each run's JSON
+report. No API key or network access is needed:
+
+    python scripts/benchmark-tarot-images.py --concurrency 8 --latency 0.5
+    python scripts/benchmark-tarot-images.py --save bench.json
+    python scripts/benchmark-tarot-images.py --baseline bench.json  # exit 1 on regression
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+GENERATOR = SCRIPTS_DIR / "generate-tarot-images.py"
+MOCK_SERVER = SCRIPTS_DIR / "mock-image-api.py"
+
+# Metric -> whether a higher value is better, for --baseline comparisons
+TRACKED = {
+    "cards_per_minute": True,
+    "peak_rss_mb": False,
+}
+
+
+def start_mock(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    command = [
+        sys.executable,
+        str(MOCK_SERVER),
+        "--port", "0",
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--image-kb", str(args.image_kb),
+        "--error-rate", str(args.error_rate),
+        "--burst-every", str(args.burst_every),
+        "--burst-length", str(args.burst_length),
+        "--retry-after", str(args.retry_after),
+        "--rpm-limit", str(args.rpm_limit),
+        "--seed", "0",
+    ]
+    mock = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    banner = mock.stdout.readline()
+    if not banner:
+        mock.kill()
+        sys.exit("Error: mock image API failed to start")
+    return mock, banner.rsplit(" ", 1)[-1].strip()
+
+
+def run_mode(name: str, concurrency: int, base_url: str, args: argparse.Namespace) -> dict:
+    """Run the generator once and return its report plus process-level measurements."""
+    with tempfile.TemporaryDirectory(prefix=f"tarot-bench-{name}-") as workdir:
+        workdir = Path(workdir)
+        report_path = workdir / "report.json"
+        command = [
+            sys.executable,
+            str(GENERATOR),
+            "--base-url", base_url,
+            "--output-dir", str(workdir / "cards"),
+            "--journal", str(workdir / "journal.jsonl"),
+            "--report", str(report_path),
+            "--concurrency", str(concurrency),
+            "--rpm", str(args.rpm),
+            "--response-format", args.response_format,
+            "--force",
+        ]
+        env = {**os.environ, "OPENAI_API_KEY": "mock-key", "PYTHONUNBUFFERED": "1"}
+        print(f"\n>>> {name}: concurrency {concurrency}")
+        output = None if args.verbose else subprocess.DEVNULL
+        process = subprocess.Popen(command, env=env, stdout=output, stderr=subprocess.STDOUT)
+        # wait4 gives this child's own rusage, so peak RSS is per mode
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode != 0:
+            sys.exit(f"Error: generator exited with {process.returncode} in {name} mode")
+        report = json.loads(report_path.read_text())
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak_rss = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    generated = report["images"].get("generated", 0)
+    requests = report["requests"]
+    return {
+        "mode": name,
+        "concurrency": concurrency,
+        "elapsed": report["elapsed"],
+        "cards": generated,
+        "cards_per_minute": round(generated / report["elapsed"] * 60, 2),
+        "peak_rss_mb": round(peak_rss, 1),
+        "requests": requests,
+        "retries": report["retries"],
+        "retry_overhead": round(report["retries"] / requests, 3) if requests else 0.0,
+        "idle_share": report["idle_share"],
+        "latency_p50": report["latency"]["p50"],
+        "latency_p95": report["latency"]["p95"],
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Return a message for every tracked metric that regressed beyond `tolerance`."""
+    previous = {row["mode"]: row for row in baseline}
+    regressions = []
+    for row in results:
+        before = previous.get(row["mode"])
+        if not before:
+            continue
+        for metric, higher_is_better in TRACKED.items():
+            old, new = before[metric], row[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(f"{row['mode']}: {metric} {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the card generator against a local mock API.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers for the concurrent mode (default: 8)")
+    parser.add_argument("--rpm", type=float, default=6000, help="Generator --rpm budget (default: 6000)")
+    parser.add_argument("--response-format", choices=("b64_json", "url"), default="b64_json")
+    parser.add_argument("--latency", type=float, default=0.3, help="Mock mean latency in seconds (default: 0.3)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Mock latency std deviation (default: 0.1)")
+    parser.add_argument("--image-kb", type=int, default=3500, help="Mock PNG size in KB (default: 3500)")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Mock 5xx share (default: 0.02)")
+    parser.add_argument("--burst-every", type=int, default=40, help="Mock 429 burst period in requests (default: 40)")
+    parser.add_argument("--burst-length", type=int, default=2, help="429s per burst (default: 2)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After on burst 429s (default: 1.0)")
+    parser.add_argument("--rpm-limit", type=int, default=0, help="Mock requests-per-minute limit (default: off)")
+    parser.add_argument("--save", type=Path, help="Write results as JSON, e.g. to use as a later --baseline")
+    parser.add_argument("--baseline", type=Path, help="Fail if results regress against this saved run")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression ratio (default: 0.2)")
+    parser.add_argument("--verbose", action="store_true", help="Show generator output")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    mock, base_url = start_mock(args)
+    print(f"Mock image API: {base_url}")
+
+    try:
+        results = [
+            run_mode("sequential", 1, base_url, args),
+            run_mode("concurrent", args.concurrency, base_url, args),
+        ]
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    print("\n" + "=" * 60)
+    print("BENCHMARK RESULTS")
+    print("=" * 60)
+    print(f"{'mode':<12}{'workers':>8}{'cards/min':>11}{'peak MB':>9}{'retries':>9}{'idle':>7}{'p95 s':>8}")
+    for row in results:
+        print(
+            f"{row['mode']:<12}{row['concurrency']:>8}{row['cards_per_minute']:>11.1f}"
+            f"{row['peak_rss_mb']:>9.1f}{row['retry_overhead']:>9.1%}{row['idle_share']:>7.0%}"
+            f"{row['latency_p95']:>8.2f}"
+        )
+    speedup = results[1]["cards_per_minute"] / results[0]["cards_per_minute"]
+    print(f"\nConcurrent speedup: {speedup:.1f}x")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Results saved: {args.save}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
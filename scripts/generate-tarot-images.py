@@ -1,242 +1,1161 @@
 #!/usr/bin/env python3
 """
 Generate all 78 tarot card images using OpenAI DALL-E 3.
+
+Cards are generated by a pool of asyncio workers sharing one HTTP client:
+
+    python scripts/generate-tarot-images.py --concurrency 4
+
+Cards come from the catalog shared with the database seed and can be
+narrowed with `--only`, `--suite` and `--arcana` for targeted rebuilds.
+
+`--base-url` points it at any compatible endpoint, such as the offline mock
+in `mock-image-api.py` that `benchmark-tarot-images.py` drives.
+
+`--styles classic,noir --candidates 2` builds alternative decks from the
+profiles in `tarot-styles.json` in the same run; each non-default deck gets
+its own directory and manifest under `public/cards/decks/{style}/`.
+
+`--optimize` then encodes resized WebP/AVIF renditions of every card
+(`/cards/{thumb,reading,full}/{code}.webp`) and writes `variants.json` with
+their dimensions, byte sizes and a blur placeholder for the frontend.
 """
 
 import os
 import sys
 import time
 import json
+import io
+import re
 import base64
+import hashlib
+import tempfile
+import random
+import asyncio
+import argparse
+import functools
 import httpx
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 # Configuration
 OUTPUT_DIR = Path(__file__).parent.parent / "public" / "cards"
 API_KEY = os.environ.get("OPENAI_API_KEY")
+BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
 
-if not API_KEY:
-    print("Error: OPENAI_API_KEY not set")
-    sys.exit(1)
-
-# Art style prompt - consistent across all cards
-ART_STYLE = """
-Art style: Mystical tarot card illustration with rich symbolism.
-Style: Art Nouveau meets contemporary digital art, reminiscent of the Rider-Waite deck but modernized.
-Colors: Deep jewel tones (sapphire blue, emerald green, amethyst purple, ruby red) with gold accents.
-Details: Intricate borders with celestial motifs, detailed symbolic imagery, atmospheric lighting.
-Quality: High detail, professional illustration quality, centered composition.
-Format: Vertical tarot card format with ornate decorative frame.
-"""
+# Image request parameters; all of them feed the build cache key
+MODEL = "dall-e-3"
+IMAGE_SIZE = "1024x1792"  # Vertical for tarot cards
+IMAGE_QUALITY = "hd"
+LOCKFILE_NAME = "images.lock.json"
+JOURNAL_PATH = Path(__file__).parent / "generate-tarot-images.journal.jsonl"
+REPORT_PATH = Path(__file__).parent / "generate-tarot-images.report.json"
+
+# Card catalog shared with the database seed (src/lib/db/seeds/tarot-deck.ts)
+CATALOG_PATH = Path(__file__).parent.parent / "src" / "lib" / "db" / "seeds" / "tarot-catalog.json"
+
+# Art style profiles, one deck each; the default deck is the one the app serves
+STYLES_PATH = Path(__file__).parent / "tarot-styles.json"
+DEFAULT_STYLE = "classic"
+SUITS = {"wands", "cups", "swords", "pentacles"}
+
+# Default request budget shared by all workers (DALL-E 3 images-per-minute limit)
+DEFAULT_RPM = 30
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2.0  # seconds; doubled on every retry
+BACKOFF_CAP = 60.0
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+RESPONSE_FORMATS = ("b64_json", "url")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Web renditions written by --optimize (name -> width; height keeps the card's aspect ratio)
+RENDITIONS = {"thumb": 256, "reading": 480, "full": 1024}
+WEBP_QUALITY = 75
+AVIF_QUALITY = 55
+PLACEHOLDER_WIDTH = 16
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every in-flight request.
+
+    Tokens refill at `rpm` per minute. A 429 or an exhausted
+    `x-ratelimit-remaining-requests` header pauses the whole bucket until the
+    server says capacity is back, so workers back off together instead of
+    each discovering the limit on its own.
+    """
+
+    def __init__(self, rpm: float, burst: int = 1):
+        self.rate = rpm / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token; returns the seconds spent waiting."""
+        requested = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - requested
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every worker for `seconds`; overlapping pauses keep the later deadline."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def observe(self, headers: httpx.Headers) -> None:
+        """Pause when the server reports the request window is used up."""
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+        if remaining is not None and reset is not None and remaining.strip() == "0":
+            self.pause(reset)
+
+
+def parse_duration(value: str | None) -> float | None:
+    """Parse OpenAI reset durations such as `20ms`, `1s` or `6m0s` into seconds."""
+    if not value:
+        return None
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(n) * scale[unit] for n, unit in parts)
+
+
+def retry_after(headers: httpx.Headers) -> float | None:
+    """Seconds the server asked us to wait, from `retry-after-ms` or `Retry-After`."""
+    if value := headers.get("retry-after-ms"):
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter, so retries from parallel workers spread out."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+def target_mode(path: Path) -> int:
+    """Mode of the file being replaced, or the umask default for a new file."""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_write(path: Path):
+    """
+    Write to a temp file next to `path` and rename it into place on success.
+
+    A crash mid-write leaves only a hidden `.tmp` file behind, never a
+    truncated PNG that a later run would mistake for a finished card.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; keep the permissions a plain open() would give.
+        # os.chmod on the name works everywhere, unlike os.fchmod.
+        os.chmod(tmp_name, target_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class Base64FieldDecoder:
+    """
+    Incrementally decode the `b64_json` string out of a streamed JSON body.
+
+    Only a short tail of the preamble and a <4 byte remainder are buffered,
+    so memory stays flat no matter how large the image is.
+    """
+
+    FIELD = re.compile(rb'"b64_json"\s*:\s*"')
+
+    def __init__(self):
+        self._buffer = b""
+        self._in_value = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        if self.done:
+            return b""
+        self._buffer += chunk
+        if not self._in_value:
+            match = self.FIELD.search(self._buffer)
+            if not match:
+                # Keep enough tail to match a field name split across chunks
+                self._buffer = self._buffer[-64:]
+                return b""
+            self._in_value = True
+            self._buffer = self._buffer[match.end():]
+
+        end = self._buffer.find(b'"')
+        if end != -1:
+            data, self._buffer, self.done = self._buffer[:end], b"", True
+        else:
+            # Hold back a trailing backslash: it may start an escape split across chunks
+            keep = len(self._buffer) - 1 if self._buffer.endswith(b"\\") else len(self._buffer)
+            data, self._buffer = self._buffer[:keep], self._buffer[keep:]
+        data = data.replace(b"\\/", b"/")
+        if not self.done:
+            cut = len(data) - len(data) % 4
+            data, self._buffer = data[:cut], data[cut:] + self._buffer
+        return base64.b64decode(data)
+
+
+@dataclass
+class AttemptMetrics:
+    """Timings and sizes for one API request; all durations are in seconds."""
+
+    job: str
+    attempt: int
+    status: int | None = None
+    wait: float = 0.0  # queued in the rate limiter before sending
+    ttfb: float = 0.0  # request sent -> response headers
+    latency: float = 0.0  # request sent -> image on disk (or failure)
+    payload_bytes: int = 0  # bytes received over the wire
+    image_bytes: int = 0  # decoded bytes written to disk
+    decode: float = 0.0
+    write: float = 0.0  # file writes, fsync and rename
+    backoff: float = 0.0  # sleep scheduled before the next attempt
+    retry_reason: str | None = None
+    error: str | None = None
+
+
+async def stream_b64_image(response: httpx.Response, output_path: Path, metrics: AttemptMetrics) -> None:
+    """Decode a streamed `b64_json` response straight to disk."""
+    decoder = Base64FieldDecoder()
+    with atomic_write(output_path) as f:
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            decode_started = time.perf_counter()
+            image_bytes = decoder.feed(chunk)
+            write_started = time.perf_counter()
+            f.write(image_bytes)
+            metrics.decode += write_started - decode_started
+            metrics.write += time.perf_counter() - write_started
+            metrics.image_bytes += len(image_bytes)
+        if not decoder.done or not metrics.image_bytes:
+            raise ValueError("response did not contain a complete b64_json image")
+        commit_started = time.perf_counter()
+    metrics.write += time.perf_counter() - commit_started
+
+
+async def download_image(client: httpx.AsyncClient, url: str, output_path: Path, metrics: AttemptMetrics) -> None:
+    """Stream an image URL to disk."""
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        with atomic_write(output_path) as f:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                write_started = time.perf_counter()
+                f.write(chunk)
+                metrics.write += time.perf_counter() - write_started
+                metrics.image_bytes += len(chunk)
+            commit_started = time.perf_counter()
+        metrics.write += time.perf_counter() - commit_started
+        metrics.payload_bytes += response.num_bytes_downloaded
+
+
+@dataclass(frozen=True, slots=True)
+class Card:
+    code: str
+    name: str
+    arcana: str
+    suit: str
+    index: int
+    prompt: str
+
+
+class Catalog:
+    """The 78 cards in deck order, with a code -> card index for selection."""
+
+    def __init__(self, cards: tuple[Card, ...]):
+        self.cards = cards
+        self.by_code = {card.code: card for card in cards}
+
+    def select(
+        self,
+        only: list[str] | None = None,
+        suits: list[str] | None = None,
+        arcana: str | None = None,
+    ) -> list[Card]:
+        """Cards matching every given filter, in deck order."""
+        if only:
+            cards = [self.by_code[code] for code in sorted(set(only), key=lambda c: self.by_code[c].index)]
+        else:
+            cards = list(self.cards)
+        if suits:
+            cards = [card for card in cards if card.suit in suits]
+        if arcana:
+            cards = [card for card in cards if card.arcana == arcana]
+        return cards
+
+
+@functools.cache
+def load_catalog() -> Catalog:
+    """Parse the shared catalog on first use only."""
+    with open(CATALOG_PATH) as f:
+        entries = json.load(f)
+    return Catalog(tuple(
+        Card(e["code"], e["name"], e["arcana"], e["suit"], e["cardIndex"], e["imagePrompt"])
+        for e in entries
+    ))
+
+
+def load_styles() -> dict[str, str]:
+    with open(STYLES_PATH) as f:
+        return json.load(f)
+
+
+@dataclass(frozen=True)
+class Job:
+    """One image to produce: a card, in one style, as one of its candidates."""
+
+    card: Card
+    deck: str
+    style: str
+    candidate: int = 0
+
+    @property
+    def output_dir(self) -> Path:
+        return deck_dir(self.deck)
+
+    @property
+    def stem(self) -> str:
+        # The first candidate keeps the plain code so the app's /cards/{code}.png still resolves
+        code = self.card.code
+        return code if self.candidate == 0 else f"{code}-{self.candidate + 1}"
+
+    @property
+    def output_path(self) -> Path:
+        return self.output_dir / f"{self.stem}.png"
+
+    @property
+    def id(self) -> str:
+        return f"{self.deck}/{self.stem}"
+
+    @property
+    def label(self) -> str:
+        if self.deck == DEFAULT_STYLE and self.candidate == 0:
+            return self.card.name
+        return f"{self.card.name} · {self.deck} #{self.candidate + 1}"
+
+
+def deck_dir(deck: str) -> Path:
+    return OUTPUT_DIR if deck == DEFAULT_STYLE else OUTPUT_DIR / "decks" / deck
+
+
+def build_jobs(cards: list[Card], styles: dict[str, str], candidates: int) -> list[Job]:
+    """Fan cards out across styles and candidates, keeping each card's variants adjacent."""
+    return [
+        Job(card, deck, style, candidate)
+        for card in cards
+        for deck, style in styles.items()
+        for candidate in range(candidates)
+    ]
+
+
+def build_prompt(card_name: str, prompt: str, style: str) -> str:
+    return f"Generate a tarot card illustration: {card_name}. {prompt}. {style}"
+
+
+def cache_key(job: Job) -> str:
+    """Hash every input that changes the generated image."""
+    inputs = {
+        "prompt": build_prompt(job.card.name, job.card.prompt, job.style),
+        "model": MODEL,
+        "size": IMAGE_SIZE,
+        "quality": IMAGE_QUALITY,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_complete_png(path: Path) -> bool:
+    """Cheap structural check: PNG signature up front, IEND chunk at the very end."""
+    with open(path, "rb") as f:
+        if f.read(8) != b"\x89PNG\r\n\x1a\n":
+            return False
+        f.seek(0, os.SEEK_END)
+        if f.tell() < 20:
+            return False
+        f.seek(-12, os.SEEK_END)
+        return f.read(12) == b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+
+class BuildCache:
+    """
+    Content-addressed record of what each card image was generated from.
+
+    The lockfile maps image name -> cache key (hash of prompt and model
+    parameters) plus the sha256 and size of the file that key produced. A
+    card is rebuilt only when its inputs changed or its file no longer
+    matches, which makes reruns an incremental build.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if path.exists():
+            self.entries = json.loads(path.read_text()).get("cards", {})
+
+    def check(self, job: Job) -> str | None:
+        """Return why the image must be (re)generated, or None if the file on disk is current."""
+        output_path = job.output_path
+        if not output_path.exists():
+            return "missing"
+        if not is_complete_png(output_path):
+            return "corrupt file"
+
+        entry = self.entries.get(job.stem)
+        key = cache_key(job)
+        if entry is None:
+            # Images generated before the lockfile existed are trusted once
+            self.record(job)
+            return None
+        if entry["key"] != key:
+            return "inputs changed"
+        if entry["bytes"] != output_path.stat().st_size or entry["sha256"] != file_digest(output_path):
+            return "file does not match lockfile"
+        return None
+
+    def record(self, job: Job) -> None:
+        self.entries[job.stem] = {
+            "key": cache_key(job),
+            "sha256": file_digest(job.output_path),
+            "bytes": job.output_path.stat().st_size,
+        }
+        self.save()
+
+    def save(self) -> None:
+        lock = {"version": 1, "model": MODEL, "cards": dict(sorted(self.entries.items()))}
+        with atomic_write(self.path) as f:
+            f.write((json.dumps(lock, indent=2) + "\n").encode())
 
-# All 78 tarot cards with specific visual prompts
-TAROT_CARDS = [
-    # Major Arcana (0-21)
-    {"code": "major_00_the_fool", "name": "The Fool", "prompt": "A young traveler in colorful clothes standing at the edge of a cliff, looking up at the sky with innocent joy, a small white dog at their feet, carrying a small bag on a stick, mountains in background, sun rising"},
-    {"code": "major_01_the_magician", "name": "The Magician", "prompt": "A robed figure standing at a table with the four suit symbols (cup, wand, sword, pentacle), one hand pointing to the sky, one to the earth, infinity symbol above head, red and white robes, roses and lilies"},
-    {"code": "major_02_the_high_priestess", "name": "The High Priestess", "prompt": "A serene woman seated between two pillars (one black, one white), crescent moon at her feet, wearing blue robes and a crown with moon phases, holding a scroll, veil with pomegranates behind her"},
-    {"code": "major_03_the_empress", "name": "The Empress", "prompt": "A regal woman on a cushioned throne in a lush garden, wearing a crown of twelve stars, flowing gown with pomegranate pattern, wheat field at her feet, Venus symbol on heart-shaped shield"},
-    {"code": "major_04_the_emperor", "name": "The Emperor", "prompt": "A stern bearded man on a stone throne carved with ram heads, wearing red robes and armor, holding an ankh scepter and orb, mountains behind, commanding presence"},
-    {"code": "major_05_the_hierophant", "name": "The Hierophant", "prompt": "A religious figure in ornate papal robes between two pillars, wearing a triple crown, holding a triple cross scepter, two acolytes kneeling before him, crossed keys at feet"},
-    {"code": "major_06_the_lovers", "name": "The Lovers", "prompt": "A man and woman standing beneath a radiant angel with purple wings, tree of knowledge with serpent behind woman, tree of flames behind man, sun blazing above"},
-    {"code": "major_07_the_chariot", "name": "The Chariot", "prompt": "An armored warrior standing in a canopied chariot pulled by two sphinxes (one black, one white), city behind, starry canopy, crescent moons on shoulders, holding a wand"},
-    {"code": "major_08_strength", "name": "Strength", "prompt": "A gentle woman in white robes calmly closing the jaws of a lion, infinity symbol above her head, flower garland in her hair, serene expression, mountain in background"},
-    {"code": "major_09_the_hermit", "name": "The Hermit", "prompt": "An old bearded figure in gray hooded robes standing on a snowy mountain peak, holding a lantern with a six-pointed star inside, leaning on a staff, looking down from height"},
-    {"code": "major_10_wheel_of_fortune", "name": "Wheel of Fortune", "prompt": "A great golden wheel with mystical symbols, sphinx at top holding sword, snake descending on left, jackal ascending on right, four winged creatures in corners (angel, eagle, lion, bull)"},
-    {"code": "major_11_justice", "name": "Justice", "prompt": "A crowned figure seated between two pillars, holding a raised sword in right hand and balanced scales in left, red and green robes, square crown, purple veil behind"},
-    {"code": "major_12_the_hanged_man", "name": "The Hanged Man", "prompt": "A man suspended upside-down by one foot from a wooden T-shaped cross, other leg bent to form a figure 4, serene face with a halo of light, hands behind back"},
-    {"code": "major_13_death", "name": "Death", "prompt": "A skeleton knight in black armor riding a white horse, carrying a black flag with white rose emblem, figures of all social classes before him, sun rising between two towers in background"},
-    {"code": "major_14_temperance", "name": "Temperance", "prompt": "A winged angel in flowing robes standing with one foot on land and one in water, pouring liquid between two cups, golden path leading to mountains, sun rising over peaks, irises growing"},
-    {"code": "major_15_the_devil", "name": "The Devil", "prompt": "A horned, bat-winged figure with a goat's head perched on a black pedestal, inverted pentagram above, two figures chained loosely to the pedestal, torch lighting"},
-    {"code": "major_16_the_tower", "name": "The Tower", "prompt": "A tall stone tower struck by lightning from dark clouds, crown toppling from top, two figures falling from windows, flames erupting, rain of golden drops falling"},
-    {"code": "major_17_the_star", "name": "The Star", "prompt": "A woman kneeling by a pool, pouring water from two jugs onto land and into water, one large eight-pointed star above with seven smaller stars around it, bird in a tree"},
-    {"code": "major_18_the_moon", "name": "The Moon", "prompt": "A full moon with a face in profile between two towers, a dog and wolf howling, a crayfish emerging from a pool, winding path leading to distant mountains, drops falling from moon"},
-    {"code": "major_19_the_sun", "name": "The Sun", "prompt": "A radiant sun with a human face, a child riding a white horse beneath, arms outstretched joyfully, sunflowers blooming behind a wall, red banner waving"},
-    {"code": "major_20_judgement", "name": "Judgement", "prompt": "An angel blowing a trumpet from clouds, figures rising from coffins below with arms raised, mountains and sea in background, flag with red cross on trumpet"},
-    {"code": "major_21_the_world", "name": "The World", "prompt": "A dancing figure wrapped in purple cloth holding two wands, enclosed in a green laurel wreath, four creatures in corners (angel, eagle, lion, bull), cosmic background"},
-
-    # Minor Arcana - Wands (22-35)
-    {"code": "minor_wands_ace", "name": "Ace of Wands", "prompt": "A hand emerging from a cloud grasping a living wooden wand with green leaves sprouting, castle on distant hill, landscape with trees, floating leaves"},
-    {"code": "minor_wands_02", "name": "Two of Wands", "prompt": "A man in red robes standing on castle battlements holding a globe in one hand, wand in other, second wand attached to wall, looking out over sea and mountains"},
-    {"code": "minor_wands_03", "name": "Three of Wands", "prompt": "A merchant figure standing on cliff with back turned, three wands planted beside, watching ships sail on golden sea, expansive horizon"},
-    {"code": "minor_wands_04", "name": "Four of Wands", "prompt": "Four wands forming a canopy decorated with garlands and flowers, two figures celebrating beneath with raised bouquets, castle in background, festive scene"},
-    {"code": "minor_wands_05", "name": "Five of Wands", "prompt": "Five youths in different colored clothes battling with wooden wands, chaotic struggle without clear winner, blue sky background"},
-    {"code": "minor_wands_06", "name": "Six of Wands", "prompt": "A victorious figure on horseback wearing a laurel wreath, holding a wand with wreath attached, crowd with five wands raised in celebration, triumphant procession"},
-    {"code": "minor_wands_07", "name": "Seven of Wands", "prompt": "A young man on a hillside defending his position with a wand against six wands attacking from below, determined expression, precarious stance"},
-    {"code": "minor_wands_08", "name": "Eight of Wands", "prompt": "Eight wands flying diagonally through clear blue sky over a river and landscape, moving swiftly toward their destination, sense of speed and motion"},
-    {"code": "minor_wands_09", "name": "Nine of Wands", "prompt": "A wounded, bandaged man leaning on a wand defensively, eight wands standing like a fence behind him, wary expression, battle-worn appearance"},
-    {"code": "minor_wands_10", "name": "Ten of Wands", "prompt": "A figure struggling to carry ten heavy wands bundled together, walking toward a distant town, bent under the burden, determined stride"},
-    {"code": "minor_wands_page", "name": "Page of Wands", "prompt": "A youth in ornate tunic decorated with salamanders, holding a tall wand and gazing at it with curiosity, desert pyramids in background, feathered cap"},
-    {"code": "minor_wands_knight", "name": "Knight of Wands", "prompt": "An armored knight on a rearing horse, brandishing a wand, salamanders on yellow tunic, pyramids and desert in background, charging forward boldly"},
-    {"code": "minor_wands_queen", "name": "Queen of Wands", "prompt": "A crowned queen on a throne decorated with lions and sunflowers, holding a wand and sunflower, black cat at her feet, confident posture, yellow robes"},
-    {"code": "minor_wands_king", "name": "King of Wands", "prompt": "A crowned king on a throne with salamander and lion motifs, holding a flowering wand, salamander at his feet, red robes, commanding presence"},
-
-    # Minor Arcana - Cups (36-49)
-    {"code": "minor_cups_ace", "name": "Ace of Cups", "prompt": "A hand emerging from cloud holding a golden chalice overflowing with five streams of water, dove descending with communion wafer, water lilies floating on pond below"},
-    {"code": "minor_cups_02", "name": "Two of Cups", "prompt": "A young man and woman exchanging cups in a pledge, caduceus with lion head rising between them, winged lion above, symbols of partnership and union"},
-    {"code": "minor_cups_03", "name": "Three of Cups", "prompt": "Three dancing maidens in flowing robes raising golden cups in celebration, garden of fruits and flowers around them, joyful harvest celebration"},
-    {"code": "minor_cups_04", "name": "Four of Cups", "prompt": "A young man sitting cross-legged under a tree, contemplating three cups before him, a hand from cloud offering fourth cup which he doesn't notice"},
-    {"code": "minor_cups_05", "name": "Five of Cups", "prompt": "A cloaked figure in black looking down at three spilled cups, two cups standing behind unnoticed, bridge over river leading to castle in distance"},
-    {"code": "minor_cups_06", "name": "Six of Cups", "prompt": "A boy offering a cup filled with flowers to a girl in a garden, five other cups with flowers nearby, old house in background, nostalgic innocence"},
-    {"code": "minor_cups_07", "name": "Seven of Cups", "prompt": "A silhouetted figure gazing at seven cups floating in clouds, each containing visions: castle, jewels, wreath, dragon, face, snake, glowing figure"},
-    {"code": "minor_cups_08", "name": "Eight of Cups", "prompt": "A cloaked figure walking away from eight stacked cups toward mountains, waning moon in sky, crossing rocky terrain, leaving behind what was built"},
-    {"code": "minor_cups_09", "name": "Nine of Cups", "prompt": "A well-dressed man sitting contentedly on a bench, nine golden cups arranged in an arc on a shelf behind him, arms crossed with satisfaction"},
-    {"code": "minor_cups_10", "name": "Ten of Cups", "prompt": "A joyful couple with arms raised toward a rainbow of ten cups in sky, two dancing children beside them, peaceful cottage and river landscape"},
-    {"code": "minor_cups_page", "name": "Page of Cups", "prompt": "A youth in floral tunic holding a cup from which a fish emerges, standing by the sea, looking at fish with wonder and curiosity"},
-    {"code": "minor_cups_knight", "name": "Knight of Cups", "prompt": "A knight in armor on a calm white horse, holding a golden cup forward, winged helmet, river and trees in background, romantic demeanor"},
-    {"code": "minor_cups_queen", "name": "Queen of Cups", "prompt": "A beautiful queen on a throne by the sea, holding an ornate covered chalice, gazing into it intently, shells and water motifs on throne"},
-    {"code": "minor_cups_king", "name": "King of Cups", "prompt": "A crowned king on a throne floating on turbulent sea, holding cup and scepter calmly, fish amulet, ship in background, master of emotions"},
-
-    # Minor Arcana - Swords (50-63)
-    {"code": "minor_swords_ace", "name": "Ace of Swords", "prompt": "A hand emerging from cloud grasping a double-edged sword crowned with a wreath and crown, six mystical drops falling, mountain peak in background"},
-    {"code": "minor_swords_02", "name": "Two of Swords", "prompt": "A blindfolded woman in white seated on stone bench, balancing two crossed swords, crescent moon over calm sea behind her"},
-    {"code": "minor_swords_03", "name": "Three of Swords", "prompt": "A red heart pierced by three swords against a backdrop of storm clouds and rain, dramatic and sorrowful imagery"},
-    {"code": "minor_swords_04", "name": "Four of Swords", "prompt": "A knight lying in repose on a tomb in a church, hands in prayer, three swords on wall above, one beneath, stained glass window"},
-    {"code": "minor_swords_05", "name": "Five of Swords", "prompt": "A smug figure holding three swords watching two dejected figures walk away, two swords on ground, stormy sky, pyrrhic victory"},
-    {"code": "minor_swords_06", "name": "Six of Swords", "prompt": "A ferryman poling a boat with a huddled woman and child, six swords standing in bow, moving from rough to calm waters"},
-    {"code": "minor_swords_07", "name": "Seven of Swords", "prompt": "A figure sneaking away from military camp carrying five swords, two swords left behind, looking back over shoulder, tents in background"},
-    {"code": "minor_swords_08", "name": "Eight of Swords", "prompt": "A blindfolded bound woman surrounded by eight swords stuck in ground, water at her feet, castle on distant cliff, imprisoned by thoughts"},
-    {"code": "minor_swords_09", "name": "Nine of Swords", "prompt": "A figure sitting up in bed in despair, head in hands, nine swords on dark wall behind, quilt decorated with roses and astrological symbols"},
-    {"code": "minor_swords_10", "name": "Ten of Swords", "prompt": "A figure lying face-down with ten swords in their back, dawn breaking over calm water in background, darkest before dawn"},
-    {"code": "minor_swords_page", "name": "Page of Swords", "prompt": "A vigilant youth holding a sword upright, standing on rocky ground, wind blowing clouds and hair, birds in sky, ready stance"},
-    {"code": "minor_swords_knight", "name": "Knight of Swords", "prompt": "An armored knight on a charging horse, sword raised high, cape and horse trappings flying in wind, storm clouds, rushing into battle"},
-    {"code": "minor_swords_queen", "name": "Queen of Swords", "prompt": "A stern queen on a stone throne with butterfly and sylph carvings, holding upright sword, one hand raised, clouds around mountain throne"},
-    {"code": "minor_swords_king", "name": "King of Swords", "prompt": "A crowned king on a throne with butterfly motifs, holding upright sword, purple robes, clear blue sky with clouds, cypress trees"},
-
-    # Minor Arcana - Pentacles (64-77)
-    {"code": "minor_pentacles_ace", "name": "Ace of Pentacles", "prompt": "A hand emerging from cloud holding a golden pentacle coin, lush garden with archway of roses below, path leading to mountains"},
-    {"code": "minor_pentacles_02", "name": "Two of Pentacles", "prompt": "A dancing figure juggling two pentacles connected by an infinity ribbon, two ships on choppy seas in background, balance and adaptability"},
-    {"code": "minor_pentacles_03", "name": "Three of Pentacles", "prompt": "A craftsman working on a cathedral arch showing design to two robed figures (monk and noble), three pentacles in the stonework, collaboration"},
-    {"code": "minor_pentacles_04", "name": "Four of Pentacles", "prompt": "A crowned figure seated, clutching a pentacle to chest, one under each foot, one on crown, city in distant background, possessiveness"},
-    {"code": "minor_pentacles_05", "name": "Five of Pentacles", "prompt": "Two impoverished figures in snow passing a lit stained-glass church window showing five pentacles, one on crutches, cold and destitute"},
-    {"code": "minor_pentacles_06", "name": "Six of Pentacles", "prompt": "A wealthy merchant in red robes holding scales, giving coins to two kneeling beggars, six pentacles arranged around the scene"},
-    {"code": "minor_pentacles_07", "name": "Seven of Pentacles", "prompt": "A young farmer leaning on a hoe, contemplating a bush bearing seven pentacles like fruit, evaluating his harvest, patient work"},
-    {"code": "minor_pentacles_08", "name": "Eight of Pentacles", "prompt": "A craftsman at a workbench carefully carving pentacles, six finished pieces displayed on post, one in hand, city in distance, apprenticeship"},
-    {"code": "minor_pentacles_09", "name": "Nine of Pentacles", "prompt": "An elegant woman in a vineyard with ripe grapes, hooded falcon on gloved hand, nine pentacles in the vines around her, luxury earned"},
-    {"code": "minor_pentacles_10", "name": "Ten of Pentacles", "prompt": "An elderly patriarch under an archway with family (man, woman, child) and dogs, ten pentacles arranged in Tree of Life pattern, estate in background"},
-    {"code": "minor_pentacles_page", "name": "Page of Pentacles", "prompt": "A youth in green tunic standing in flowering meadow, holding up a pentacle and gazing at it with fascination, trees in background"},
-    {"code": "minor_pentacles_knight", "name": "Knight of Pentacles", "prompt": "A knight on a steady black horse, holding a pentacle, plowed field in background, oak leaves on helmet, methodical and reliable"},
-    {"code": "minor_pentacles_queen", "name": "Queen of Pentacles", "prompt": "A crowned queen on a throne decorated with fruit and flowers, holding a pentacle in her lap, rabbit nearby, lush garden throne room"},
-    {"code": "minor_pentacles_king", "name": "King of Pentacles", "prompt": "A crowned king on a throne carved with bull heads, surrounded by vines and grapes, holding pentacle and scepter, castle and gardens behind"},
-]
-
-
-def generate_image(prompt: str, card_name: str, output_path: Path, retry_count: int = 3) -> bool:
+
+class JobJournal:
+    """
+    Append-only JSON-lines log of a generation run, fsynced after every record.
+
+    Records every attempt (see AttemptMetrics) and every image
+    outcome, so an interrupted run leaves an exact account of what finished.
+    `--resume` replays it to schedule only the images that did not.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.run_id = time.strftime("%Y%m%dT%H%M%S") + f"-{os.getpid()}"
+        self.root_id = self.run_id
+        self.results: dict[str, str] = {}
+        self.attempts: list[AttemptMetrics] = []
+
+    def _append(self, record: dict) -> None:
+        record = {"ts": round(time.time(), 3), "run": self.run_id, **record}
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start(self, jobs: list[Job], options: dict, resume_of: str | None = None) -> None:
+        self.root_id = resume_of or self.run_id
+        # A record torn by a crash has no newline; don't glue this run's start onto it
+        if self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb+") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        self._append({
+            "event": "run_start",
+            "root": self.root_id,
+            "jobs": [job.id for job in jobs],
+            "options": options,
+        })
+
+    def attempt(self, metrics: AttemptMetrics) -> None:
+        self.attempts.append(metrics)
+        record = {
+            key: round(value, 4) if isinstance(value, float) else value
+            for key, value in asdict(metrics).items()
+        }
+        self._append({"event": "attempt", **record})
+
+    def finish(self, job_id: str, result: str, reason: str | None = None) -> None:
+        self.results[job_id] = result
+        # Per-image roll-up of its attempts, so slow or flaky cards stand out
+        attempts = [a for a in self.attempts if a.job == job_id]
+        self._append({
+            "event": "job",
+            "job": job_id,
+            "result": result,
+            "reason": reason,
+            "attempts": len(attempts),
+            "latency": round(sum(a.latency for a in attempts), 4),
+            "idle": round(sum(a.wait + a.backoff for a in attempts), 4),
+            "payload_bytes": sum(a.payload_bytes for a in attempts),
+            "image_bytes": sum(a.image_bytes for a in attempts),
+        })
+
+    def end(self, interrupted: bool = False) -> None:
+        self._append({"event": "run_end", "interrupted": interrupted, "results": self.results})
+
+    @staticmethod
+    def pending(path: Path) -> tuple[str, dict, list[str]] | None:
+        """
+        Replay the journal for the most recent run and everything resuming it.
+
+        Returns (root run id, its options, job ids still unfinished), or None
+        when there is no journal. Torn trailing lines from a crash are ignored.
+        """
+        if not path.exists():
+            return None
+        records = []
+        for line in path.read_text().splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        starts = [r for r in records if r.get("event") == "run_start"]
+        if not starts:
+            return None
+        root = starts[-1]["root"]
+        origin = next(r for r in starts if r["run"] == root)
+        chain = {r["run"] for r in starts if r["root"] == root}
+        done = {
+            r["job"]
+            for r in records
+            if r.get("event") == "job" and r["run"] in chain and r["result"] in ("generated", "skipped")
+        }
+        return root, origin["options"], [job_id for job_id in origin["jobs"] if job_id not in done]
+
+
+async def generate_image(
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    journal: JobJournal,
+    job: Job,
+    response_format: str = "b64_json",
+    retry_count: int = MAX_ATTEMPTS,
+) -> bool:
     """Generate a single tarot card image using OpenAI DALL-E 3."""
-    full_prompt = f"Generate a tarot card illustration: {card_name}. {prompt}. {ART_STYLE}"
+    card_name = job.label
+    output_path = job.output_path
+    full_prompt = build_prompt(job.card.name, job.card.prompt, job.style)
 
     for attempt in range(retry_count):
+        delay = backoff_delay(attempt)
+        metrics = AttemptMetrics(job.id, attempt + 1)
+        retry_reason = None
+        print(f"  [{card_name}] Generating (attempt {attempt + 1}/{retry_count})...")
+        metrics.wait = await limiter.acquire()
+        started = time.perf_counter()
         try:
-            print(f"  Generating (attempt {attempt + 1}/{retry_count})...")
-
-            # Call OpenAI DALL-E 3 API directly
-            response = httpx.post(
-                "https://api.openai.com/v1/images/generations",
-                headers={
-                    "Authorization": f"Bearer {API_KEY}",
-                    "Content-Type": "application/json",
-                },
+            # Call OpenAI DALL-E 3 API directly, streaming the body to disk.
+            # DALL-E 3 only accepts n=1, so extra candidates are separate jobs.
+            image_url = None
+            async with client.stream(
+                "POST",
+                "/images/generations",
+                headers={"Authorization": f"Bearer {API_KEY}"},
                 json={
-                    "model": "dall-e-3",
+                    "model": MODEL,
                     "prompt": full_prompt,
                     "n": 1,
-                    "size": "1024x1792",  # Vertical for tarot cards
-                    "quality": "hd",
-                    "response_format": "b64_json",
+                    "size": IMAGE_SIZE,
+                    "quality": IMAGE_QUALITY,
+                    "response_format": response_format,
                 },
-                timeout=120.0,
-            )
+            ) as response:
+                metrics.ttfb = time.perf_counter() - started
+                metrics.status = response.status_code
+                limiter.observe(response.headers)
 
-            if response.status_code == 200:
-                data = response.json()
-                image_b64 = data["data"][0]["b64_json"]
-                image_bytes = base64.b64decode(image_b64)
+                if response.status_code == 200:
+                    if response_format == "url":
+                        data = json.loads(await response.aread())
+                        image_url = data["data"][0]["url"]
+                    else:
+                        await stream_b64_image(response, output_path, metrics)
 
-                with open(output_path, "wb") as f:
-                    f.write(image_bytes)
-                print(f"  Saved: {output_path}")
-                return True
+                elif response.status_code == 429:
+                    await response.aread()
+                    server_wait = retry_after(response.headers)
+                    if server_wait is not None:
+                        delay = server_wait + random.uniform(0, 1)
+                    limiter.pause(delay)
+                    print(f"  [{card_name}] Rate limited. Pausing all workers {delay:.1f} seconds...")
+                    # The limiter pause already holds this worker along with the others
+                    retry_reason, delay = "rate limited", 0.0
 
-            elif response.status_code == 429:
-                wait_time = 60
-                print(f"  Rate limited. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
+                else:
+                    metrics.error = (await response.aread()).decode(errors="replace")[:200]
+                    print(f"  [{card_name}] Error {response.status_code}: {metrics.error}")
+                    if response.status_code not in RETRYABLE_STATUS:
+                        return False
+                    retry_reason = f"http {response.status_code}"
+                    delay = max(delay, retry_after(response.headers) or 0)
 
-            else:
-                error_msg = response.text[:200]
-                print(f"  Error {response.status_code}: {error_msg}")
-                if attempt < retry_count - 1:
-                    time.sleep(10)
+                metrics.payload_bytes = response.num_bytes_downloaded
+
+            if response.status_code == 200:
+                # Download only after the API response is released, so a
+                # worker never holds two pooled connections at once
+                if image_url:
+                    await download_image(client, image_url, output_path, metrics)
+                print(f"  [{card_name}] Saved: {output_path} ({metrics.image_bytes / 1024 / 1024:.1f} MB)")
+                return True
+
+        except OSError as e:
+            # httpx wraps network failures in its own exceptions, so this is a
+            # local disk error: paying for another image would not fix it
+            metrics.error = str(e)[:200]
+            print(f"  [{card_name}] Could not save image: {metrics.error}")
+            raise
 
         except Exception as e:
-            print(f"  Error: {str(e)[:200]}")
-            if attempt < retry_count - 1:
-                time.sleep(10)
+            metrics.error = str(e)[:200]
+            retry_reason = type(e).__name__
+            print(f"  [{card_name}] Error: {metrics.error}")
+
+        finally:
+            metrics.latency = time.perf_counter() - started
+            if retry_reason and attempt < retry_count - 1:
+                metrics.retry_reason = retry_reason
+                metrics.backoff = delay
+            journal.attempt(metrics)
+
+        if attempt < retry_count - 1:
+            await asyncio.sleep(delay)
 
     return False
 
 
-def main():
-    """Generate all 78 tarot card images."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+async def generate_all(
+    jobs: list[Job],
+    journal: JobJournal,
+    concurrency: int,
+    rpm: float,
+    response_format: str,
+    force: bool = False,
+    base_url: str = BASE_URL,
+) -> dict[str, str]:
+    """Run every job, across all decks, through one bounded pool of workers sharing one HTTP client."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for i, job in enumerate(jobs):
+        queue.put_nowait((i, job))
 
-    print(f"Output directory: {OUTPUT_DIR}")
-    print(f"Total cards to generate: {len(TAROT_CARDS)}")
-    print(f"Using OpenAI DALL-E 3")
-    print("-" * 60)
+    limiter = RateLimiter(rpm)
+    caches: dict[str, BuildCache] = {}
+    for job in jobs:
+        if job.deck not in caches:
+            job.output_dir.mkdir(parents=True, exist_ok=True)
+            caches[job.deck] = BuildCache(job.output_dir / LOCKFILE_NAME)
 
-    # Track progress
-    generated = []
-    failed = []
-    skipped = []
+    async def worker(client: httpx.AsyncClient) -> None:
+        while True:
+            try:
+                i, job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-    for i, card in enumerate(TAROT_CARDS):
-        code = card["code"]
-        name = card["name"]
-        prompt = card["prompt"]
-        output_path = OUTPUT_DIR / f"{code}.png"
+            cache = caches[job.deck]
+            print(f"\n[{i+1}/{len(jobs)}] {job.label} ({job.id})")
 
-        print(f"\n[{i+1}/{len(TAROT_CARDS)}] {name} ({code})")
+            # Skip if the image on disk was built from the current inputs
+            reason = "forced" if force else cache.check(job)
+            if reason is None:
+                print(f"  Up to date, skipping...")
+                journal.finish(job.id, "skipped")
+                continue
+            print(f"  Rebuilding: {reason}")
 
-        # Skip if already exists
-        if output_path.exists():
-            print(f"  Already exists, skipping...")
-            skipped.append(code)
-            continue
+            if await generate_image(client, limiter, journal, job, response_format):
+                cache.record(job)
+                journal.finish(job.id, "generated", reason)
+            else:
+                journal.finish(job.id, "failed", reason)
 
-        # Generate image
-        if generate_image(prompt, name, output_path):
-            generated.append(code)
-        else:
-            failed.append(code)
+    # No default auth header: `url` downloads go to a third-party CDN
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=120.0,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    ) as client:
+        workers = [asyncio.create_task(worker(client)) for _ in range(concurrency)]
+        await asyncio.gather(*workers)
+
+    return journal.results
+
+
+def optimize_card(source: Path, output_dir: Path) -> dict:
+    """
+    Encode the web renditions of one card PNG and describe them.
+
+    Runs in a worker process. Renditions newer than the source PNG are reused
+    as-is, so repeated runs only pay for cards that were regenerated.
+    """
+    from PIL import Image, features
+
+    formats = ["webp"] + (["avif"] if features.check("avif") else [])
+    source_mtime = source.stat().st_mtime
+
+    with Image.open(source) as original:
+        image = original.convert("RGB")
+
+    entry = {"width": image.width, "height": image.height, "variants": {}}
+    for rendition, width in RENDITIONS.items():
+        width = min(width, image.width)
+        height = round(image.height * width / image.width)
+        resized = None
+        entry["variants"][rendition] = {}
+        for fmt in formats:
+            path = output_dir / rendition / f"{source.stem}.{fmt}"
+            if not path.exists() or path.stat().st_mtime < source_mtime:
+                if resized is None:
+                    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with atomic_write(path) as f:
+                    if fmt == "webp":
+                        resized.save(f, "WEBP", quality=WEBP_QUALITY, method=6)
+                    else:
+                        resized.save(f, "AVIF", quality=AVIF_QUALITY, speed=6)
+            entry["variants"][rendition][fmt] = {
+                "src": f"/cards/{rendition}/{path.name}",
+                "width": width,
+                "height": height,
+                "bytes": path.stat().st_size,
+            }
+
+    # Tiny inline preview for next/image `placeholder="blur"`
+    placeholder = image.resize(
+        (PLACEHOLDER_WIDTH, round(image.height * PLACEHOLDER_WIDTH / image.width)),
+        Image.Resampling.BILINEAR,
+    )
+    buffer = io.BytesIO()
+    placeholder.save(buffer, "WEBP", quality=40)
+    entry["blurDataURL"] = "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+    return entry
+
+
+def optimize_assets(cards: list[Card], workers: int | None) -> None:
+    """Encode WebP/AVIF renditions for every card PNG across a process pool."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Error: --optimize needs Pillow (pip install pillow)")
+        sys.exit(1)
+
+    sources = [OUTPUT_DIR / f"{card.code}.png" for card in cards]
+    sources = [path for path in sources if path.exists()]
+
+    print("\n" + "=" * 60)
+    print(f"OPTIMIZING {len(sources)} CARDS")
+    print("=" * 60)
+
+    entries: dict[str, dict] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(optimize_card, path, OUTPUT_DIR): path.stem for path in sources}
+        for future in as_completed(futures):
+            code = futures[future]
+            try:
+                entries[code] = future.result()
+            except Exception as e:
+                print(f"  [{code}] Error: {str(e)[:200]}")
+                continue
+            sizes = ", ".join(
+                f"{name} {variant['webp']['bytes'] / 1024:.0f} KB"
+                for name, variant in entries[code]["variants"].items()
+            )
+            print(f"  [{code}] {sizes}")
+
+    # Merge into the existing manifest so a filtered run keeps the other cards
+    manifest_path = OUTPUT_DIR / "variants.json"
+    merged = dict(entries)
+    if manifest_path.exists():
+        merged = {**json.loads(manifest_path.read_text()).get("cards", {}), **entries}
+    manifest = {
+        "renditions": RENDITIONS,
+        "cards": {card.code: merged[card.code] for card in load_catalog().cards if card.code in merged},
+    }
+    with atomic_write(manifest_path) as f:
+        f.write(json.dumps(manifest, indent=2).encode())
+
+    source_bytes = sum(path.stat().st_size for path in sources)
+    reading_bytes = sum(e["variants"]["reading"]["webp"]["bytes"] for e in entries.values())
+    print(f"\nSource PNGs: {source_bytes / 1024 / 1024:.1f} MB")
+    print(f"Reading-size WebP: {reading_bytes / 1024 / 1024:.1f} MB")
+    print(f"Variants manifest saved: {manifest_path}")
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return round(ordered[int(rank) - 1], 3)
+
+
+def build_report(
+    journal: JobJournal,
+    jobs: list[Job],
+    elapsed: float,
+    concurrency: int,
+    rpm: float,
+    interrupted: bool = False,
+) -> dict:
+    """Summarize a run's attempts into the figures needed to tune concurrency and --rpm."""
+    attempts = journal.attempts
+    ok = [a for a in attempts if a.status == 200 and a.error is None]
+    outcomes = Counter(journal.results.get(job.id, "not run") for job in jobs)
+    minutes = elapsed / 60 if elapsed else float("nan")
+
+    limiter_wait = sum(a.wait for a in attempts)
+    backoff = sum(a.backoff for a in attempts)
+    decode = sum(a.decode for a in attempts)
+    write = sum(a.write for a in attempts)
+    ttfb = sum(a.ttfb for a in attempts)
+    transfer = sum(a.latency for a in attempts) - ttfb - decode - write
+    worker_time = elapsed * concurrency
+
+    return {
+        "run": journal.run_id,
+        "interrupted": interrupted,
+        "elapsed": round(elapsed, 3),
+        "concurrency": concurrency,
+        "rpm_budget": rpm,
+        "images": dict(outcomes),
+        "requests": len(attempts),
+        "retries": sum(1 for a in attempts if a.retry_reason),
+        "retry_reasons": dict(Counter(a.retry_reason for a in attempts if a.retry_reason)),
+        "status_codes": dict(Counter(str(a.status) for a in attempts)),
+        "latency": {"p50": percentile([a.latency for a in ok], 50), "p95": percentile([a.latency for a in ok], 95)},
+        "ttfb": {"p50": percentile([a.ttfb for a in ok], 50), "p95": percentile([a.ttfb for a in ok], 95)},
+        "achieved_rpm": round(len(attempts) / minutes, 2),
+        "images_per_minute": round(outcomes["generated"] / minutes, 2),
+        "payload_bytes": sum(a.payload_bytes for a in attempts),
+        # Seconds summed over all workers; idle_share divides by workers x wall time
+        "time": {
+            "limiter_wait": round(limiter_wait, 3),
+            "backoff": round(backoff, 3),
+            "ttfb": round(ttfb, 3),
+            "transfer": round(transfer, 3),
+            "decode": round(decode, 3),
+            "write": round(write, 3),
+        },
+        "idle_share": round((limiter_wait + backoff) / worker_time, 4) if worker_time else None,
+    }
+
+
+def split_list(value: str | None) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate tarot card images using OpenAI DALL-E 3.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of cards generated in parallel (default: 1, i.e. sequential)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=DEFAULT_RPM,
+        help=f"Requests per minute shared by all workers (default: {DEFAULT_RPM})",
+    )
+    parser.add_argument(
+        "--response-format",
+        choices=RESPONSE_FORMATS,
+        default="b64_json",
+        help="Receive images inline as base64 or as a URL to download (default: b64_json)",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="After generating, write WebP/AVIF renditions and variants.json",
+    )
+    parser.add_argument(
+        "--optimize-only",
+        action="store_true",
+        help="Skip generation and only optimize the PNGs already on disk",
+    )
+    parser.add_argument(
+        "--optimize-workers",
+        type=int,
+        default=None,
+        help="Encoder processes for --optimize (default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Regenerate every card even if {LOCKFILE_NAME} says it is up to date",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Replay the journal and only generate cards the last run did not finish",
+    )
+    parser.add_argument(
+        "--styles",
+        default=DEFAULT_STYLE,
+        help=f"Comma-separated style profiles from {STYLES_PATH.name}, one deck each (default: {DEFAULT_STYLE})",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="Images API base URL, e.g. a local mock-image-api.py (default: $OPENAI_BASE_URL or OpenAI)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=OUTPUT_DIR,
+        help="Where card images, manifests and lockfiles go (default: public/cards)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=JOURNAL_PATH,
+        help=f"Job journal used by --resume (default: {JOURNAL_PATH.name})",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=REPORT_PATH,
+        help=f"Where to write the JSON run report (default: {REPORT_PATH.name})",
+    )
+    parser.add_argument(
+        "--only",
+        help="Comma-separated card codes to build, e.g. major_00_the_fool,minor_cups_ace",
+    )
+    parser.add_argument(
+        "--suite",
+        help="Comma-separated suits to build: wands, cups, swords, pentacles",
+    )
+    parser.add_argument(
+        "--arcana",
+        choices=("major", "minor"),
+        help="Only build the major or minor arcana",
+    )
+    parser.add_argument(
+        "--candidates",
+        type=int,
+        default=1,
+        help="Images generated per card and style, to pick from (default: 1)",
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.rpm <= 0:
+        parser.error("--rpm must be positive")
+    if args.candidates < 1:
+        parser.error("--candidates must be at least 1")
+    args.styles = split_list(args.styles)
+    args.only = split_list(args.only)
+    args.suite = split_list(args.suite)
+    unknown_cards = set(args.only) - set(load_catalog().by_code)
+    if unknown_cards:
+        parser.error(f"unknown card code(s) {', '.join(sorted(unknown_cards))}; see {CATALOG_PATH.name}")
+    unknown_suits = set(args.suite) - SUITS
+    if unknown_suits:
+        parser.error(f"unknown suit(s) {', '.join(sorted(unknown_suits))}; choose from {', '.join(sorted(SUITS))}")
+    unknown = set(args.styles) - set(load_styles())
+    if unknown:
+        parser.error(f"unknown style(s) {', '.join(sorted(unknown))}; see {STYLES_PATH}")
+    return args
+
+
+def select_cards(args: argparse.Namespace) -> list[Card]:
+    return load_catalog().select(args.only, args.suite, args.arcana)
+
+
+def run_generation(args: argparse.Namespace) -> None:
+    """Generate every card for each requested deck and write the deck manifests."""
+    global OUTPUT_DIR
 
-        # Rate limiting - pause between requests
-        if i < len(TAROT_CARDS) - 1:
-            time.sleep(2)  # 2 second delay between cards
+    if not API_KEY:
+        print("Error: OPENAI_API_KEY not set")
+        sys.exit(1)
+
+    journal = JobJournal(args.journal)
+    options = {
+        "force": args.force,
+        "styles": args.styles,
+        "candidates": args.candidates,
+        "output_dir": str(OUTPUT_DIR),
+        "base_url": args.base_url,
+        "response_format": args.response_format,
+    }
+    resume_of = None
+    remaining = None
+
+    if args.resume:
+        replay = JobJournal.pending(args.journal)
+        if replay is None or not replay[2]:
+            print("Nothing to resume: the last run finished every card.")
+            return
+        resume_of, recorded, remaining = replay
+        # Journals from before these were recorded fall back to the current flags
+        options = {**options, **recorded}
+        print(f"Resuming run {resume_of}: {len(remaining)} unfinished images")
+
+    # Resume into the same directory and API the original run used
+    OUTPUT_DIR = Path(options["output_dir"])
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    args.base_url = options["base_url"]
+    args.response_format = options["response_format"]
+
+    all_styles = load_styles()
+    styles = {name: all_styles[name] for name in options["styles"]}
+    if remaining is not None:
+        jobs = build_jobs(list(load_catalog().cards), styles, options["candidates"])
+        jobs = [job for job in jobs if job.id in set(remaining)]
+    else:
+        jobs = build_jobs(select_cards(args), styles, options["candidates"])
+
+    print(f"Output directory: {OUTPUT_DIR}")
+    print(f"Decks: {', '.join(styles)} ({options['candidates']} candidate(s) per card)")
+    print(f"Total images to generate: {len(jobs)}")
+    print(f"Using OpenAI DALL-E 3 (concurrency: {args.concurrency}, budget: {args.rpm:g} rpm)")
+    print(f"API: {args.base_url}")
+    print(f"Journal: {args.journal}")
+    print("-" * 60)
+
+    journal.start(jobs, options, resume_of)
+    started = time.monotonic()
+    interrupted = True
+    try:
+        asyncio.run(
+            generate_all(
+                jobs,
+                journal,
+                args.concurrency,
+                args.rpm,
+                args.response_format,
+                options["force"],
+                args.base_url,
+            )
+        )
+        interrupted = False
+    finally:
+        journal.end(interrupted)
+        # Written even on Ctrl-C so the manifests never claim more than the journal,
+        # and so an interrupted long run still leaves a report to tune from
+        for deck in dict.fromkeys(job.deck for job in jobs):
+            write_manifest(deck, jobs, journal.results, options["candidates"])
+        elapsed = time.monotonic() - started
+        report = build_report(journal, jobs, elapsed, args.concurrency, args.rpm, interrupted)
+        with atomic_write(args.report) as f:
+            f.write(json.dumps(report, indent=2).encode())
+
+    results = journal.results
+
+    # Track progress, in deck order regardless of completion order
+    generated = [job.id for job in jobs if results.get(job.id) == "generated"]
+    skipped = [job.id for job in jobs if results.get(job.id) == "skipped"]
+    failed = [job.id for job in jobs if results.get(job.id) == "failed"]
 
     # Summary
     print("\n" + "=" * 60)
     print("GENERATION COMPLETE")
     print("=" * 60)
     print(f"Generated: {len(generated)}")
-    print(f"Skipped (existing): {len(skipped)}")
+    print(f"Skipped (up to date): {len(skipped)}")
     print(f"Failed: {len(failed)}")
+    print(f"Elapsed: {elapsed:.1f}s")
+    if generated:
+        print(f"Throughput: {len(generated) / elapsed * 3600:.0f} images/hour")
+    if report["requests"]:
+        print(f"Latency p50/p95: {report['latency']['p50']}s / {report['latency']['p95']}s")
+        print(f"Achieved: {report['achieved_rpm']} rpm, {report['retries']} retries")
+        print(f"Idle in rate-limit/backoff sleeps: {report['idle_share']:.0%} of worker time")
+    print(f"Report saved: {args.report}")
 
     if failed:
-        print(f"\nFailed cards: {', '.join(failed)}")
+        print(f"\nFailed images: {', '.join(failed)}")
+
 
-    # Save manifest
+def write_manifest(deck: str, jobs: list[Job], results: dict[str, str], candidates: int) -> None:
+    """Record this run's outcomes for one deck plus which cards actually have a PNG on disk."""
+    deck_jobs = [job for job in jobs if job.deck == deck]
+    output_dir = deck_dir(deck)
+    output_dir.mkdir(parents=True, exist_ok=True)
     manifest = {
-        "total": len(TAROT_CARDS),
-        "generated": generated,
-        "skipped": skipped,
-        "failed": failed,
+        "total": len(load_catalog().cards),
+        "style": deck,
+        "candidates": candidates,
+        "generated": [job.stem for job in deck_jobs if results.get(job.id) == "generated"],
+        "skipped": [job.stem for job in deck_jobs if results.get(job.id) == "skipped"],
+        "failed": [job.stem for job in deck_jobs if results.get(job.id) == "failed"],
+        "missing": [c.code for c in load_catalog().cards if not (output_dir / f"{c.code}.png").exists()],
     }
-    manifest_path = OUTPUT_DIR / "manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    manifest_path = output_dir / "manifest.json"
+    with atomic_write(manifest_path) as f:
+        f.write(json.dumps(manifest, indent=2).encode())
     print(f"\nManifest saved: {manifest_path}")
 
 
+def main():
+    global OUTPUT_DIR
+
+    args = parse_args()
+    # Absolute, so a --resume started from another directory writes to the same place
+    OUTPUT_DIR = args.output_dir.resolve()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    if not args.optimize_only:
+        try:
+            run_generation(args)
+        except KeyboardInterrupt:
+            print("\nInterrupted. Run again with --resume to finish the remaining cards.")
+            print(f"Partial report saved: {args.report}")
+            sys.exit(130)
+    if args.optimize or args.optimize_only:
+        optimize_assets(select_cards(args), args.optimize_workers)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI images API, for offline benchmarking.
+
+Serves POST /v1/images/generations with a realistic, valid base64 PNG payload
+(or a URL to download it from), with configurable latency, random server
+errors, scripted 429 bursts and a requests-per-minute limit that answers with
+the same Retry-After / x-ratelimit-* headers as the real API:
+
+    python scripts/mock-image-api.py --port 8089 --latency 1.5 --error-rate 0.05
+    python scripts/generate-tarot-images.py --base-url http://127.0.0.1:8089/v1
+
+Uses only the standard library.
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+IMAGE_WIDTH = 1024
+IMAGE_HEIGHT = 1792
+CHUNK_SIZE = 64 * 1024
+
+
+def make_png(target_bytes: int) -> bytes:
+    """
+    Build a valid 1024x1792 RGB PNG of roughly `target_bytes`.
+
+    Enough rows are filled with random (incompressible) pixels to reach the
+    target size; the rest are black and compress to almost nothing.
+    """
+    row_bytes = IMAGE_WIDTH * 3
+    noisy_rows = min(IMAGE_HEIGHT, max(1, target_bytes // (row_bytes + 1)))
+    raw = bytearray()
+    for y in range(IMAGE_HEIGHT):
+        raw.append(0)  # filter type: none
+        raw += os.urandom(row_bytes) if y < noisy_rows else bytes(row_bytes)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", IMAGE_WIDTH, IMAGE_HEIGHT, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(bytes(raw), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+class MockState:
+    """Counters shared by all handler threads."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.png = make_png(args.image_kb * 1024)
+        self.b64 = base64.b64encode(self.png)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.window: deque[float] = deque()
+        self.random = random.Random(args.seed)
+
+    def next_outcome(self) -> tuple[int, dict[str, str]]:
+        """Decide the status and rate-limit headers for the next generation request."""
+        args = self.args
+        with self.lock:
+            self.requests += 1
+            now = time.monotonic()
+            while self.window and now - self.window[0] >= 60:
+                self.window.popleft()
+
+            headers = {}
+            if args.rpm_limit:
+                reset = 60 - (now - self.window[0]) if self.window else 60
+                remaining = max(0, args.rpm_limit - len(self.window) - 1)
+                headers = {
+                    "x-ratelimit-limit-requests": str(args.rpm_limit),
+                    "x-ratelimit-remaining-requests": str(remaining),
+                    "x-ratelimit-reset-requests": f"{reset:.3f}s",
+                }
+                if len(self.window) >= args.rpm_limit:
+                    headers["retry-after"] = f"{reset:.3f}"
+                    return 429, headers
+
+            in_burst = args.burst_every and (self.requests - 1) % args.burst_every < args.burst_length
+            if in_burst:
+                headers["retry-after"] = str(args.retry_after)
+                return 429, headers
+
+            self.window.append(now)
+            if self.random.random() < args.error_rate:
+                return self.random.choice((500, 502, 503)), headers
+            return 200, headers
+
+    def delay(self) -> float:
+        with self.lock:
+            return max(0.0, self.random.gauss(self.args.latency, self.args.jitter))
+
+
+class MockImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: MockState
+
+    def log_message(self, format, *args):
+        if self.state.args.verbose:
+            super().log_message(format, *args)
+
+    def send_body(self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        # Stream in chunks so clients see a realistic transfer, not one write
+        for start in range(0, len(body), CHUNK_SIZE):
+            self.wfile.write(body[start:start + CHUNK_SIZE])
+
+    def do_GET(self):
+        if self.path.startswith("/files/"):
+            self.send_body(200, self.state.png, "image/png")
+        else:
+            self.send_body(404, b'{"error": {"message": "not found"}}', "application/json")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            request = {}
+
+        if self.path.rstrip("/") != "/v1/images/generations":
+            self.send_body(404, b'{"error": {"message": "not found"}}', "application/json")
+            return
+
+        status, headers = self.state.next_outcome()
+        time.sleep(self.state.delay())
+
+        if status != 200:
+            error = {"error": {"message": f"mock {status}", "type": "server_error" if status >= 500 else "requests"}}
+            self.send_body(status, json.dumps(error).encode(), "application/json", headers)
+            return
+
+        n = int(request.get("n", 1))
+        created = int(time.time())
+        if request.get("response_format") == "url":
+            host = self.headers.get("Host", f"127.0.0.1:{self.server.server_port}")
+            items = [{"url": f"http://{host}/files/{created}-{i}.png"} for i in range(n)]
+            body = json.dumps({"created": created, "data": items}).encode()
+        else:
+            revised = json.dumps(request.get("prompt", "")[:200])
+            item = b'{"revised_prompt": ' + revised.encode() + b', "b64_json": "' + self.state.b64 + b'"}'
+            body = b'{"created": %d, "data": [' % created + b", ".join([item] * n) + b"]}"
+        self.send_body(200, body, "application/json", headers)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve a local mock of the OpenAI images API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089, help="0 picks a free port")
+    parser.add_argument("--latency", type=float, default=1.0, help="Mean seconds before responding (default: 1.0)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Std deviation of the latency (default: 0.2)")
+    parser.add_argument("--image-kb", type=int, default=3500, help="Approximate PNG size in KB (default: 3500)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 5xx")
+    parser.add_argument("--rpm-limit", type=int, default=0, help="Requests per minute before answering 429 (0: off)")
+    parser.add_argument("--burst-every", type=int, default=0, help="Start a burst of 429s every N requests (0: off)")
+    parser.add_argument("--burst-length", type=int, default=3, help="Consecutive 429s per burst (default: 3)")
+    parser.add_argument("--retry-after", type=float, default=2.0, help="Retry-After seconds sent with burst 429s")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and error sampling")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    MockImageHandler.state = MockState(args)
+    server = ThreadingHTTPServer((args.host, args.port), MockImageHandler)
+    server.daemon_threads = True
+    # First line is machine-readable so callers using --port 0 can find the server
+    print(f"Mock image API listening on http://{args.host}:{server.server_port}/v1", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
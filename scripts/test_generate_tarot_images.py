@@ -0,0 +1,331 @@
+"""
+Tests for generate-tarot-images.py: rate limiting, retries, streaming decode,
+the build cache and the resume journal. No network or API key needed:
+
+    python -m pytest scripts
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+SCRIPT = Path(__file__).parent / "generate-tarot-images.py"
+spec = importlib.util.spec_from_file_location("generate_tarot_images", SCRIPT)
+gen = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = gen
+spec.loader.exec_module(gen)
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n"
+PNG_TAIL = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+
+def fake_png(body: bytes = b"pixels") -> bytes:
+    return PNG_HEAD + body + PNG_TAIL
+
+
+def make_card(code: str = "major_00_the_fool") -> "gen.Card":
+    return gen.Card(code, code.replace("_", " ").title(), "major", "none", 0, "A figure at a cliff edge")
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(gen, "OUTPUT_DIR", tmp_path)
+    return tmp_path
+
+
+# --- rate-limit headers ---------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("20ms", 0.02), ("1s", 1.0), ("6m0s", 360.0), ("1h2m3.5s", 3723.5), ("", None), (None, None), ("soon", None)],
+)
+def test_parse_duration(value, expected):
+    assert gen.parse_duration(value) == expected
+
+
+def test_retry_after_prefers_milliseconds():
+    headers = httpx.Headers({"retry-after-ms": "1500", "retry-after": "9"})
+    assert gen.retry_after(headers) == 1.5
+
+
+def test_retry_after_seconds_and_http_date():
+    assert gen.retry_after(httpx.Headers({"retry-after": "2.5"})) == 2.5
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert gen.retry_after(httpx.Headers({"retry-after": past})) == 0.0
+    assert gen.retry_after(httpx.Headers({"retry-after": "later"})) is None
+    assert gen.retry_after(httpx.Headers({})) is None
+
+
+# --- RateLimiter ----------------------------------------------------------
+
+
+def test_rate_limiter_spaces_requests():
+    async def run():
+        limiter = gen.RateLimiter(rpm=600)  # one token every 0.1s
+        return [await limiter.acquire() for _ in range(3)]
+
+    waits = asyncio.run(run())
+    assert waits[0] < 0.05
+    assert all(0.08 <= wait <= 0.2 for wait in waits[1:])
+
+
+def test_rate_limiter_pause_holds_acquire():
+    async def run():
+        limiter = gen.RateLimiter(rpm=60_000)
+        limiter.pause(0.2)
+        limiter.pause(0.05)  # an earlier deadline does not shorten the pause
+        return await limiter.acquire()
+
+    assert asyncio.run(run()) >= 0.19
+
+
+def test_rate_limiter_observes_exhausted_window():
+    limiter = gen.RateLimiter(rpm=60)
+    limiter.observe(httpx.Headers({"x-ratelimit-remaining-requests": "3", "x-ratelimit-reset-requests": "5s"}))
+    assert limiter.paused_until == 0.0
+
+    before = time.monotonic()
+    limiter.observe(httpx.Headers({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "250ms"}))
+    assert before + 0.25 <= limiter.paused_until <= time.monotonic() + 0.25
+
+
+# --- Base64FieldDecoder ---------------------------------------------------
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_base64_decoder_handles_any_chunking(seed):
+    rng = random.Random(seed)
+    image = rng.randbytes(5000)
+    # JSON encoders may escape "/" as "\/"; the decoder must undo that too
+    encoded = base64.b64encode(image).decode().replace("/", "\\/")
+    body = ('{"created": 1, "data": [{"revised_prompt": "x", "b64_json": "' + encoded + '"}]}').encode()
+
+    decoder = gen.Base64FieldDecoder()
+    decoded = b""
+    position = 0
+    while position < len(body):
+        size = rng.randint(1, 97)
+        decoded += decoder.feed(body[position:position + size])
+        position += size
+
+    assert decoder.done
+    assert decoded == image
+
+
+# --- atomic_write ---------------------------------------------------------
+
+
+def test_atomic_write_keeps_normal_permissions(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "fchmod", raising=False)  # as on Windows before 3.13
+    umask = os.umask(0o022)
+    try:
+        new_file = tmp_path / "new.png"
+        with gen.atomic_write(new_file) as f:
+            f.write(b"new")
+        assert new_file.stat().st_mode & 0o777 == 0o644
+
+        existing = tmp_path / "existing.png"
+        existing.write_bytes(b"old")
+        existing.chmod(0o640)
+        with gen.atomic_write(existing) as f:
+            f.write(b"replaced")
+        assert existing.read_bytes() == b"replaced"
+        assert existing.stat().st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+# --- BuildCache -----------------------------------------------------------
+
+
+def test_build_cache_check(output_dir):
+    job = gen.Job(make_card(), gen.DEFAULT_STYLE, "oil painting")
+    lockfile = output_dir / gen.LOCKFILE_NAME
+    cache = gen.BuildCache(lockfile)
+
+    assert cache.check(job) == "missing"
+
+    job.output_path.write_bytes(PNG_HEAD + b"truncated")
+    assert cache.check(job) == "corrupt file"
+
+    # A complete image without a lock entry is adopted and recorded
+    job.output_path.write_bytes(fake_png())
+    assert cache.check(job) is None
+    assert json.loads(lockfile.read_text())["cards"][job.stem]["key"] == gen.cache_key(job)
+
+    reloaded = gen.BuildCache(lockfile)
+    assert reloaded.check(job) is None
+    assert reloaded.check(gen.Job(job.card, job.deck, "watercolor")) == "inputs changed"
+
+    job.output_path.write_bytes(fake_png(b"different pixels"))
+    assert reloaded.check(job) == "file does not match lockfile"
+
+
+# --- JobJournal -----------------------------------------------------------
+
+
+def test_journal_pending_follows_resume_chain(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    assert gen.JobJournal.pending(path) is None
+
+    cards = [make_card(f"major_0{i}_card") for i in range(3)]
+    jobs = gen.build_jobs(cards, {gen.DEFAULT_STYLE: "style"}, 1)
+    options = {"force": False, "styles": [gen.DEFAULT_STYLE], "candidates": 1}
+
+    first = gen.JobJournal(path)
+    first.run_id = "run-1"
+    first.start(jobs, options)
+    first.finish(jobs[0].id, "generated", "missing")
+    first.finish(jobs[1].id, "failed", "missing")
+    first.end(interrupted=True)
+    with open(path, "a") as f:
+        f.write('{"event": "job", "run": "run-1", "job": "clas')  # torn by a crash
+
+    assert gen.JobJournal.pending(path) == ("run-1", options, [jobs[1].id, jobs[2].id])
+
+    second = gen.JobJournal(path)
+    second.run_id = "run-2"
+    second.start(jobs[1:], options, resume_of="run-1")
+    second.finish(jobs[1].id, "generated", "missing")
+
+    assert gen.JobJournal.pending(path) == ("run-1", options, [jobs[2].id])
+
+
+# --- generate_image against a scripted mock -------------------------------
+
+
+def run_scripted(
+    output_dir,
+    responses: list[httpx.Response],
+    retry_count: int = gen.MAX_ATTEMPTS,
+    sent: list[float] | None = None,
+):
+    """Drive generate_image against an in-process mock that answers with `responses` in order."""
+    sent = [] if sent is None else sent
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        return responses[len(sent) - 1]
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(base_url="http://mock/v1", transport=transport) as client:
+            limiter = gen.RateLimiter(rpm=60_000)
+            journal = gen.JobJournal(output_dir / "journal.jsonl")
+            job = gen.Job(make_card(), gen.DEFAULT_STYLE, "style")
+            ok = await gen.generate_image(client, limiter, journal, job, retry_count=retry_count)
+            return ok, journal.attempts, job
+
+    ok, attempts, job = asyncio.run(run())
+    return ok, attempts, job, sent
+
+
+def test_generate_image_retries_429_then_503(output_dir, monkeypatch):
+    # No jitter, so the only pause before the second request is the server's Retry-After
+    monkeypatch.setattr(gen.random, "uniform", lambda low, high: 0.0)
+    image = fake_png(os.urandom(2048))
+    ok, attempts, job, sent = run_scripted(
+        output_dir,
+        [
+            httpx.Response(429, headers={"retry-after": "0.3"}, json={"error": {"message": "slow down"}}),
+            httpx.Response(503, json={"error": {"message": "overloaded"}}),
+            httpx.Response(200, json={"data": [{"b64_json": base64.b64encode(image).decode()}]}),
+        ],
+    )
+
+    assert ok
+    assert job.output_path.read_bytes() == image
+    assert len(sent) == 3
+    assert [a.status for a in attempts] == [429, 503, 200]
+    assert [a.retry_reason for a in attempts] == ["rate limited", "http 503", None]
+    assert sent[1] - sent[0] >= 0.3
+    assert attempts[1].wait >= 0.29
+    assert attempts[2].image_bytes == len(image)
+
+
+def test_generate_image_does_not_retry_client_errors(output_dir):
+    ok, attempts, job, sent = run_scripted(
+        output_dir,
+        [httpx.Response(400, json={"error": {"message": "content policy violation"}})],
+    )
+
+    assert not ok
+    assert len(sent) == 1
+    assert len(attempts) == 1
+    assert attempts[0].status == 400
+    assert attempts[0].retry_reason is None
+    assert "content policy" in attempts[0].error
+    assert not job.output_path.exists()
+
+
+def test_generate_image_gives_up_after_retry_count(output_dir, monkeypatch):
+    monkeypatch.setattr(gen.random, "uniform", lambda low, high: 0.0)
+    ok, attempts, job, sent = run_scripted(output_dir, [httpx.Response(500)] * 3, retry_count=3)
+
+    assert not ok
+    assert len(sent) == 3
+    # The final attempt schedules no retry
+    assert [a.retry_reason for a in attempts] == ["http 500", "http 500", None]
+
+
+def test_generate_image_does_not_pay_again_for_a_failed_write(output_dir, monkeypatch):
+    def disk_full(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(gen.os, "replace", disk_full)
+    image = base64.b64encode(fake_png()).decode()
+    sent = []
+    with pytest.raises(OSError, match="No space left"):
+        run_scripted(output_dir, [httpx.Response(200, json={"data": [{"b64_json": image}]})] * 3, sent=sent)
+
+    assert len(sent) == 1
+    assert not list(output_dir.glob("*.png"))
+
+
+# --- run_generation / --resume --------------------------------------------
+
+
+def test_resume_from_another_directory_uses_original_output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(gen, "OUTPUT_DIR", gen.OUTPUT_DIR)  # main() reassigns it
+    monkeypatch.setattr(gen, "API_KEY", "test-key")
+    runs = []
+
+    async def fake_generate_all(jobs, journal, concurrency, rpm, response_format, force=False, base_url=gen.BASE_URL):
+        # Finish nothing, so every job is still pending on --resume
+        runs.append({"output_dir": gen.OUTPUT_DIR, "base_url": base_url, "paths": {job.output_path for job in jobs}})
+        return journal.results
+
+    monkeypatch.setattr(gen, "generate_all", fake_generate_all)
+    journal, report = tmp_path / "journal.jsonl", tmp_path / "report.json"
+    common = ["generate-tarot-images.py", "--journal", str(journal), "--report", str(report)]
+
+    first_cwd = tmp_path / "first"
+    first_cwd.mkdir()
+    monkeypatch.chdir(first_cwd)
+    monkeypatch.setattr(
+        sys, "argv", common + ["--output-dir", "out2", "--base-url", "http://mock/v1", "--only", "major_00_the_fool"]
+    )
+    gen.main()
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    monkeypatch.setattr(sys, "argv", common + ["--resume"])
+    gen.main()
+
+    expected = first_cwd / "out2"
+    assert [run["output_dir"] for run in runs] == [expected, expected]
+    assert runs[1]["base_url"] == "http://mock/v1"
+    assert runs[1]["paths"] == {expected / "major_00_the_fool.png"}
+    assert not (elsewhere / "out2").exists()
@@ -0,0 +1,47 @@
+import { describe, it, expect } from "vitest";
+import {
+  TAROT_CATALOG,
+  TAROT_DECK,
+  DECK_METADATA,
+} from "@/lib/db/seeds/tarot-deck";
+
+describe("Tarot deck seed", () => {
+  it("has one seed card per catalog entry, in catalog order", () => {
+    expect(TAROT_DECK).toHaveLength(DECK_METADATA.totalCards);
+    expect(TAROT_DECK.map((card) => card.code)).toEqual(
+      TAROT_CATALOG.map((entry) => entry.code)
+    );
+  });
+
+  it("takes arcana, suit and index from the shared catalog", () => {
+    TAROT_DECK.forEach((card, i) => {
+      const entry = TAROT_CATALOG[i];
+      expect(card.arcana).toBe(entry?.arcana);
+      expect(card.suit).toBe(entry?.suit);
+      expect(card.cardIndex).toBe(entry?.cardIndex);
+    });
+  });
+
+  it("numbers the cards 0-77 with unique codes", () => {
+    expect(TAROT_DECK.map((card) => card.cardIndex)).toEqual(
+      Array.from({ length: 78 }, (_, i) => i)
+    );
+    expect(new Set(TAROT_DECK.map((card) => card.code)).size).toBe(78);
+  });
+
+  it("splits into 22 major and 56 minor arcana, 14 cards per suit", () => {
+    const major = TAROT_DECK.filter((card) => card.arcana === "major");
+    expect(major).toHaveLength(DECK_METADATA.majorArcanaCount);
+    expect(major.every((card) => card.suit === "none")).toBe(true);
+
+    for (const suit of ["wands", "cups", "swords", "pentacles"] as const) {
+      expect(TAROT_DECK.filter((card) => card.suit === suit)).toHaveLength(14);
+    }
+  });
+
+  it("has an image prompt for every catalog entry", () => {
+    for (const entry of TAROT_CATALOG) {
+      expect(entry.imagePrompt.length).toBeGreaterThan(0);
+    }
+  });
+});